@@ -3,11 +3,9 @@ Standard models for RV data
 """
 
 import datetime
-import hashlib
 import importlib
 import os
 import warnings
-from collections import OrderedDict
 
 import git
 import pandas as pd
@@ -18,6 +16,10 @@ from core.models.definitions import FITS_TYPE_MAP, INSTRUMENT_READERS
 from core.models.receipt_columns import RECEIPT_COL
 from core.tools.git import get_git_branch, get_git_revision_hash, get_git_tag
 
+# instrument name -> resolved reader method, so repeated conversions skip
+# the import/getattr dispatch chain
+_READER_CACHE = {}
+
 
 class RVDataModel(object):
     """The base class for all RV data models.
@@ -41,7 +43,7 @@ class RVDataModel(object):
 
             This stores all header information from the FITS file as a dictionary
             with extension name as the keys and the header content as the values.
-            Headers are stored as OrderedDict types.
+            Headers are stored as plain dict (insertion-ordered) types.
 
         data (dict): a dictionary of data of each extension (HDU)
 
@@ -77,9 +79,9 @@ class RVDataModel(object):
         self.level = None  # level of data model is set in each derived class
         self.read_methods = INSTRUMENT_READERS
 
-        self.extensions = OrderedDict()  # map name to FITS type
-        self.headers = OrderedDict()  # map name to extension header
-        self.data = OrderedDict()  # map name to extension data
+        self.extensions = {}  # map name to FITS type
+        self.headers = {}  # map name to extension header
+        self.data = {}  # map name to extension data
         self.receipt = pd.DataFrame([])
 
     # =============================================================================
@@ -131,15 +133,23 @@ class RVDataModel(object):
 
         self.filename = os.path.basename(fn)
         self.dirname = os.path.dirname(fn)
-        with fits.open(fn) as hdu_list:
-            # Handles the Receipt and the auxilary HDUs
+        # Open lazily and memory-mapped so only the HDUs actually accessed
+        # are parsed and paged in; readonly is astropy's mmap fast path.
+        hdu_list = fits.open(fn, mode="readonly", memmap=True, lazy_load_hdus=True)
+        try:
+            # Handles the Receipt and the auxilary HDUs. On the
+            # standard-format path (no instrument) non-RECEIPT tables are
+            # left to the lazy level reader so they are not materialized
+            # unless actually consumed; instrument-native tables keep the
+            # eager conversion since the instrument readers do not defer.
             for hdu in hdu_list:
                 if isinstance(hdu, fits.PrimaryHDU):
                     self.headers[hdu.name] = hdu.header
                 elif isinstance(hdu, fits.BinTableHDU):
-                    t = Table.read(hdu)
+                    self.headers[hdu.name] = hdu.header
                     if "RECEIPT" in hdu.name:
                         # Table contains the RECEIPT
+                        t = Table.read(hdu)
                         df: pd.DataFrame = t.to_pandas()
                         # TODO: get receipt columns from core.models.config.BASE-RECEIPT-columns.csv
                         df = df.reindex(
@@ -149,8 +159,8 @@ class RVDataModel(object):
                         )
                         setattr(self, hdu.name, df)
                         setattr(self, hdu.name.lower(), getattr(self, hdu.name))
-                    self.headers[hdu.name] = hdu.header
-                    setattr(self, hdu.name, t.to_pandas())
+                    elif instrument is not None:
+                        setattr(self, hdu.name, Table.read(hdu).to_pandas())
 
             # Leave the rest of HDUs to level specific readers
             if instrument is None:
@@ -159,27 +169,44 @@ class RVDataModel(object):
                 method = core.models.level2.RV2._read
                 method(self, hdu_list)
             elif instrument in self.read_methods.keys():
-                module = importlib.import_module(
-                    self.read_methods[instrument]["module"]
-                )
-                cls = getattr(module, self.read_methods[instrument]["class"])
-                method = getattr(cls, self.read_methods[instrument]["method"])
+                method = _READER_CACHE.get(instrument)
+                if method is None:
+                    module = importlib.import_module(
+                        self.read_methods[instrument]["module"]
+                    )
+                    cls = getattr(module, self.read_methods[instrument]["class"])
+                    method = getattr(cls, self.read_methods[instrument]["method"])
+                    _READER_CACHE[instrument] = method
                 method(self, hdu_list)
             else:
                 # the provided data_type is not recognized, ie.
                 # not in the self.read_methods list
                 raise IOError("cannot recognize data type {}".format(instrument))
-        # compute MD5 sum of source file and write it into a receipt entry for tracking.
-        # Note that MD5 sum has known security vulnerabilities, but we are only using
-        # this to ensure data integrity, and there is no known reason for someone to try
-        # to hack astronomical data files.  If something more secure is is needed,
-        # substitute hashlib.sha256 for hashlib.md5
-        md5 = hashlib.md5()
-        with open(fn, "rb") as f:
-            for chunk in iter(lambda: f.read(4096), b""):
-                md5.update(chunk)
+        except Exception:
+            hdu_list.close()
+            raise
+
+        # Readers that defer HDU loading keep the HDUList alive by storing
+        # it on the instance; close it otherwise.
+        if getattr(self, "_hdul", None) is not hdu_list:
+            hdu_list.close()
         self.receipt_add_entry("from_fits", "PASS")
 
+    def close(self):
+        """
+        Release the open FITS file backing deferred extensions
+
+        Readers that defer HDU loading keep the source HDUList - an open
+        file descriptor plus its memory maps - alive on the instance.
+        Call this once the needed extensions have been materialized
+        (e.g. between files in a batch conversion); extensions still
+        deferred cannot be loaded afterwards.
+        """
+        hdul = getattr(self, "_hdul", None)
+        if hdul is not None:
+            hdul.close()
+            self._hdul = None
+
     def to_fits(self, fn):
         """
         Collect the content of this instance into a monolithic FITS file
@@ -195,6 +222,33 @@ class RVDataModel(object):
             # we only want to write to a '.fits file
             raise NameError("filename must end with .fits")
 
+        if not os.path.isdir(os.path.dirname(fn)):
+            os.makedirs(os.path.dirname(fn), exist_ok=True)
+
+        iter_hdus = getattr(self, "_iter_hdus", None)
+        if iter_hdus is not None:
+            # Stream one HDU at a time so peak memory during the save is
+            # the largest single extension, not the whole product.
+            written = False
+            for hdu in iter_hdus():
+                if not written:
+                    hdu.writeto(
+                        fn,
+                        overwrite=True,
+                        output_verify="silentfix",
+                        checksum=False,
+                    )
+                    written = True
+                else:
+                    # append through an explicit handle so the write
+                    # keeps the same output_verify policy as above
+                    # (fits.append would verify with the default 'fix')
+                    out = fits.open(fn, mode="append", memmap=True)
+                    out.append(hdu)
+                    out.close(output_verify="silentfix")
+            if written:
+                return
+
         gen_hdul = getattr(self, "_create_hdul", None)
         if gen_hdul is None:
             raise TypeError("Write method not found. Is this the base class?")
@@ -203,9 +257,7 @@ class RVDataModel(object):
 
         # finish up writing
         hdul = fits.HDUList(hdu_list)
-        if not os.path.isdir(os.path.dirname(fn)):
-            os.makedirs(os.path.dirname(fn), exist_ok=True)
-        hdul.writeto(fn, overwrite=True, output_verify="silentfix")
+        hdul.writeto(fn, overwrite=True, output_verify="silentfix", checksum=False)
         hdul.close()
 
     # =============================================================================
@@ -276,7 +328,7 @@ class RVDataModel(object):
         Args:
             ext_name (str): name of extension, will be forced uppercase
             ext_type: FITS data type as string (e.g. BinTableHDU)
-            header (OrderedDict): optional header to initialize extension header
+            header (dict): optional header to initialize extension header
             data: optional data to initialize extension data
         """
 
@@ -289,9 +341,9 @@ class RVDataModel(object):
 
         self.extensions[ext_name] = ext_type
 
-        # NOTE: OrderDict(None) and np.array(None) don't work, so use [] to init.
+        # NOTE: dict(None) and np.array(None) don't work, so use [] to init.
         if header is None:
-            self.headers[ext_name] = OrderedDict([])
+            self.headers[ext_name] = dict([])
         else:
             self.headers[ext_name] = header
         if data is None:
@@ -311,16 +363,26 @@ class RVDataModel(object):
             del self.headers[ext_name]
             del self.data[ext_name]
             del self.extensions[ext_name]
+            self._drop_deferred(ext_name)
         else:
             warnings.warn(f"Cannot delete nonexistent extension {ext_name}")
 
+    def _drop_deferred(self, ext_name):
+        """
+        Invalidate any deferred-HDU entry and cached attribute for an
+        extension whose data was replaced or deleted, so lazy readers
+        do not resurrect stale file content
+        """
+        self.__dict__.get("_hdu_index", {}).pop(ext_name, None)
+        self.__dict__.pop(ext_name, None)
+
     def set_header(self, ext_name, header):
         """
         Set extension header
 
         Args:
             ext_name (str): name of extension, will be forced uppercase
-            header (OrderedDict): header to set extension header
+            header (dict): header to set extension header
         """
         # check whether the extension already exist
         if ext_name in self.extensions.keys():
@@ -340,6 +402,7 @@ class RVDataModel(object):
         if ext_name in self.extensions.keys():
             if isinstance(data, type(FITS_TYPE_MAP[self.extensions[ext_name]]([]))):
                 self.data[ext_name] = data
+                self._drop_deferred(ext_name)
             else:
                 raise TypeError(
                     f"Data type does not match extension {ext_name} data type"
@@ -1,13 +1,13 @@
-from collections import OrderedDict
 from pathlib import Path
 
 import numpy as np
 import pandas as pd
 
 # mapping between fits extension data types and Python object data types
+# (asarray keeps already-ndarray inputs zero-copy)
 FITS_TYPE_MAP = {
-    "PrimaryHDU": OrderedDict,
-    "ImageHDU": np.array,
+    "PrimaryHDU": dict,
+    "ImageHDU": np.asarray,
     "BinTableHDU": pd.DataFrame,
 }
 
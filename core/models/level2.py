@@ -2,6 +2,8 @@
 Level 2 Data Model for RV spectral data
 """
 
+import warnings
+
 # External dependencies
 from astropy.io import fits
 from astropy.table import Table
@@ -11,6 +13,39 @@ import pandas as pd
 import core.models.base
 from core.models.definitions import LEVEL2_EXTENSIONS
 
+# extension name -> FITS type lookup, computed once at import so _read
+# does not rebuild an index per file
+_EXTENSION_TYPES = dict(zip(LEVEL2_EXTENSIONS["Name"], LEVEL2_EXTENSIONS["DataType"]))
+
+
+def _bintable_to_pandas(hdu):
+    """
+    Convert a BinTableHDU to a DataFrame column-at-a-time
+
+    Building the frame directly from the record array skips the astropy
+    Table intermediate (and its extra pass over the data). Byte-string
+    columns are decoded to match Table.to_pandas; anything the direct
+    path cannot represent (e.g. multidimensional columns) falls back to
+    the Table route.
+    """
+    rec = hdu.data
+    try:
+        cols = {}
+        for name in rec.dtype.names:
+            col = np.asarray(rec[name])
+            if col.ndim > 1:
+                raise ValueError("multidimensional column")
+            if col.dtype.kind == "S":
+                col = np.char.decode(col, "utf-8")
+            elif not col.dtype.isnative:
+                # FITS stores big-endian; match the native byte order
+                # Table.to_pandas produced
+                col = col.astype(col.dtype.newbyteorder("="))
+            cols[name] = col
+        return pd.DataFrame(cols)
+    except (ValueError, UnicodeDecodeError):
+        return Table(rec).to_pandas()
+
 
 class RV2(core.models.base.RVDataModel):
     """
@@ -23,36 +58,98 @@ class RV2(core.models.base.RVDataModel):
         super().__init__()
         self.level = 2
 
+        # HDUs indexed in _read but not yet materialized, and the open
+        # HDUList backing them
+        self._hdu_index = {}
+        self._hdul = None
+
         # TODO: initialize header keywords for each extension
 
-        for i, row in LEVEL2_EXTENSIONS.iterrows():
-            if row["Required"]:
+        # itertuples avoids the per-row Series construction of iterrows
+        for row in LEVEL2_EXTENSIONS.itertuples(index=False):
+            if row.Required:
                 # TODO: set description and comment
-                self.create_extension(row["Name"], row["DataType"])
+                self.create_extension(row.Name, row.DataType)
 
     def _read(self, hdul: fits.HDUList) -> None:
-        l2_ext = LEVEL2_EXTENSIONS.set_index("Name")
-
-        for hdu in hdul:
+        # Record where each extension lives in the file and defer reading
+        # the data itself until first access, so opening a file costs
+        # O(accessed extensions) rather than O(all extensions).
+        self._hdul = hdul
+        for idx, hdu in enumerate(hdul):
             if 'TRACE' in hdu.name:
                 t1 = 'TRACE1_' + hdu.name.split('_')[1]
-                fits_type = l2_ext.loc[t1]["DataType"]
+                fits_type = _EXTENSION_TYPES[t1]
             else:
-                fits_type = l2_ext.loc[hdu.name]["DataType"]
+                fits_type = _EXTENSION_TYPES[hdu.name]
             if hdu.name not in self.extensions.keys():
                 self.create_extension(hdu.name, fits_type)
 
-            if hdu.name == "PRIMARY":
-                pass
-            elif fits_type == "ImageHDU":
-                data = np.array(hdu.data)
-                self.set_data(hdu.name, data)
-            elif fits_type == "BinTableHDU":
-                data = Table(hdu.data).to_pandas()
-                self.set_data(hdu.name, data)
+            if hdu.name != "PRIMARY" and fits_type in ("ImageHDU", "BinTableHDU"):
+                self._hdu_index[hdu.name] = (idx, fits_type)
 
             self.set_header(hdu.name, hdu.header)
 
+    def __getattr__(self, name):
+        # Only called when normal attribute lookup fails: materialize
+        # extensions indexed by _read on first access.
+        index = self.__dict__.get("_hdu_index")
+        if index and name in index:
+            # _load_hdu also caches the attribute in self.__dict__
+            return self._load_hdu(name)
+        raise AttributeError(
+            "{} object has no attribute {}".format(self.__class__.__name__, name)
+        )
+
+    def _load_hdu(self, name):
+        """
+        Materialize a deferred extension recorded by ``_read``, caching
+        the result in ``self.data`` and as an instance attribute so
+        later attribute access works regardless of which path
+        materialized it
+        """
+        idx, fits_type = self._hdu_index.pop(name)
+        hdu = self._hdul[idx]
+        if fits_type == "ImageHDU":
+            data = np.asarray(hdu.data)
+        else:
+            data = _bintable_to_pandas(hdu)
+        self.data[name] = data
+        self.__dict__[name] = data
+        return data
+
+    def _get_data(self, name):
+        """
+        Return extension data, materializing it first if still deferred
+        """
+        if name in self._hdu_index:
+            return self._load_hdu(name)
+        return self.data[name]
+
+    def get_column(self, ext_name, column):
+        """
+        Read a single column of a table extension
+
+        For extensions still deferred by ``_read`` this reads just the
+        requested column from the file (served by astropy as an mmap
+        slice) without ever building the full DataFrame.
+
+        Args:
+            ext_name (str): name of a BinTableHDU extension
+            column (str): column name
+
+        Returns:
+            numpy.ndarray: the column values
+        """
+        if ext_name in self._hdu_index:
+            idx, fits_type = self._hdu_index[ext_name]
+            if fits_type != "BinTableHDU":
+                raise TypeError(
+                    "Extension {} is not a table extension".format(ext_name)
+                )
+            return np.asarray(self._hdul[idx].data.field(column))
+        return np.asarray(self.data[ext_name][column])
+
     def info(self):
         """
         Pretty print information about this data to stdout
@@ -82,6 +179,22 @@ class RV2(core.models.base.RVDataModel):
             if name == "PRIMARY":
                 continue
 
+            if name in self._hdu_index:
+                # still deferred: report shape from the header without
+                # loading the data
+                idx, fits_type = self._hdu_index[name]
+                hdu = self._hdul[idx]
+                if fits_type == "ImageHDU":
+                    row = "|{:20s} |{:20s} |{:20s}\n".format(
+                        name, "array", str(hdu.shape)
+                    )
+                else:
+                    row = "|{:20s} |{:20s} |{:20s}\n".format(
+                        name, "table", str(hdu.header.get("NAXIS2", 0))
+                    )
+                head += row
+                continue
+
             ext = self.data[name]
             if isinstance(ext, np.ndarray):
                 row = "|{:20s} |{:20s} |{:20s}\n".format(name, "array", str(ext.shape))
@@ -91,59 +204,72 @@ class RV2(core.models.base.RVDataModel):
                 head += row
         print(head)
 
-    def _create_hdul(self):
+    def _build_primary_hdu(self, key):
+        """Build the PRIMARY HDU for ``_create_hdul``"""
+        head = fits.Header(self.headers[key])
+        return fits.PrimaryHDU(header=head)
+
+    def _build_image_hdu(self, key):
+        """Build an image extension HDU for ``_create_hdul``"""
+        data = self._get_data(key)
+        # NAXIS/NAXISn are derived from the data by astropy on
+        # construction, no need to maintain them by hand
+        head = fits.Header(self.headers[key])
+        try:
+            hdu = fits.ImageHDU(data=data, header=head)
+        except KeyError as ke:
+            if str(ke) == "'bool'":
+                warnings.warn(
+                    f"Casting boolean data of extension {key} for FITS output"
+                )
+                # a uint8 view keeps 1 byte per pixel (BITPIX=8)
+                # instead of allocating a float64 copy
+                data = data.view(np.uint8)
+                hdu = fits.ImageHDU(data=data, header=head)
+            else:
+                raise KeyError("A different error...")
+        hdu.name = key
+        return hdu
+
+    def _build_bintable_hdu(self, key):
+        """Build a binary-table extension HDU for ``_create_hdul``"""
+        table = Table.from_pandas(self._get_data(key))
+        head = fits.Header(self.headers[key])
+        hdu = fits.BinTableHDU(data=table, header=head)
+        hdu.name = key
+        return hdu
+
+    # FITS type string -> builder method, so _create_hdul resolves each
+    # extension with one dict lookup instead of an if/elif chain
+    _HDU_BUILDERS = {
+        "PrimaryHDU": _build_primary_hdu,
+        "ImageHDU": _build_image_hdu,
+        "BinTableHDU": _build_bintable_hdu,
+    }
+
+    def _iter_hdus(self):
         """
-        Create an hdul in FITS format.
-        This is used by the base model for writing data context to file
+        Yield the HDUs of this data product one at a time, PRIMARY first.
+
+        Used by the base model to stream the product to disk without
+        holding every serialized extension in memory at once.
         """
-        hdu_list = []
-        hdu_definitions = self.extensions.items()
-        for key, value in hdu_definitions:
-            hduname = key
-            if value == "PrimaryHDU":
-                head = fits.Header(self.headers[key])
-                hdu = fits.PrimaryHDU(header=head)
-                hdu_list.insert(0, hdu)
-            elif value == "ImageHDU":
-                data = self.data[key]
-                if data is None:
-                    ndim = 0
-                else:
-                    ndim = len(data.shape)
-                self.headers[key]["NAXIS"] = ndim
-                if ndim == 0:
-                    self.headers[key]["NAXIS1"] = 0
-                else:
-                    for d in range(ndim):
-                        self.headers[key]["NAXIS{}".format(d + 1)] = data.shape[d]
-                head = fits.Header(self.headers[key])
-                try:
-                    hdu = fits.ImageHDU(data=data, header=head)
-                    hdu.name = hduname
-                    hdu_list.append(hdu)
-                except KeyError as ke:
-                    print("KeyError exception raised: -->ke=" + str(ke))
-                    print("Attempting to handle it...")
-                    if str(ke) == "'bool'":
-                        data = data.astype(float)
-                        print("------>SHAPE=" + str(data.shape))
-                        hdu = fits.ImageHDU(data=data, header=head)
-                        hdu_list.append(hdu)
-                    else:
-                        raise KeyError("A different error...")
-            elif value == "BinTableHDU":
-                table = Table.from_pandas(self.data[key])
-                self.headers[key]["NAXIS1"] = len(table)
-                head = fits.Header(self.headers[key])
-                hdu = fits.BinTableHDU(data=table, header=head)
-                hdu.name = hduname
-                hdu_list.append(hdu)
-            else:
-                print(
+        items = list(self.extensions.items())
+        items.sort(key=lambda item: item[1] != "PrimaryHDU")
+        for key, value in items:
+            builder = self._HDU_BUILDERS.get(value)
+            if builder is None:
+                warnings.warn(
                     "Can't translate {} into a valid FITS format.".format(
                         type(self.data[key])
                     )
                 )
                 continue
+            yield builder(self, key)
 
-        return hdu_list
+    def _create_hdul(self):
+        """
+        Create an hdul in FITS format.
+        This is used by the base model for writing data context to file
+        """
+        return list(self._iter_hdus())
@@ -0,0 +1,59 @@
+"""
+Optional CFITSIO-backed FITS access for I/O-heavy reader paths.
+
+Instrument readers that repeatedly probe headers or pull single image
+extensions can go through this facade instead of calling
+``astropy.io.fits`` directly. When the ``fitsio`` package (CFITSIO
+bindings) is installed it is used for header parsing and data reads,
+which avoids constructing a Python Card object per keyword and is
+substantially faster on header-heavy and compressed files. When
+``fitsio`` is not available, everything falls back to astropy and
+behaves identically.
+"""
+
+from astropy.io import fits
+
+try:
+    import fitsio
+
+    _USE_FITSIO = True
+except ImportError:
+    fitsio = None
+    _USE_FITSIO = False
+
+
+def get_header(path, ext=0):
+    """
+    Read the header of a single FITS extension.
+
+    Args:
+        path (str): path to the FITS file
+        ext (int or str): extension index or name, defaults to primary
+
+    Returns:
+        a mapping supporting dict-style keyword access (``fitsio.FITSHDR``
+        or ``astropy.io.fits.Header`` depending on the active backend)
+    """
+    if _USE_FITSIO:
+        return fitsio.read_header(path, ext=ext)
+    # positional so astropy accepts an extension name as well as an index
+    # (its ext= keyword only takes integers)
+    return fits.getheader(path, ext)
+
+
+def read_data(path, ext=0):
+    """
+    Read the data of a single FITS extension.
+
+    Args:
+        path (str): path to the FITS file
+        ext (int or str): extension index or name, defaults to primary
+
+    Returns:
+        numpy.ndarray: the extension data
+    """
+    if _USE_FITSIO:
+        return fitsio.read(path, ext=ext)
+    # positional so astropy accepts an extension name as well as an index
+    # (its ext= keyword only takes integers)
+    return fits.getdata(path, ext)
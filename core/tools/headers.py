@@ -1,6 +1,10 @@
 import unicodedata
+from functools import lru_cache
 
 
+# Header values and descriptions repeat heavily across files (unit
+# strings, "nan", common descriptors), so memoize the normalization.
+@lru_cache(maxsize=4096)
 def to_ascii_safe(input_string):
     # Normalize the string to NFKD form
     normalized_string = unicodedata.normalize("NFKD", input_string)
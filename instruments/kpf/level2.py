@@ -3,11 +3,56 @@ from astropy.table import Table
 import numpy as np
 import pandas as pd
 import os
-from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 
 # import base class
 from core.models.level2 import RV2
 
+# standard <-> KPF keyword map, parsed once at import rather than on
+# every _read call
+_HEADER_MAP = pd.read_csv(
+    os.path.join(os.path.dirname(__file__), 'config/header_map.csv'), header=0
+)
+
+# instrument keywords referenced by the map, for the single-pass header
+# scan in _read
+_MAPPED_KEYS = frozenset(k for k in _HEADER_MAP['INSTRUMENT'] if pd.notnull(k))
+
+# The KPF extension layout is fixed, so the per-trace extension names
+# are precomputed once instead of f-string formatting them on every
+# _read call. Each entry maps an output TRACE prefix to the (flux,
+# wave, var) extension names of the GREEN and RED chips.
+_SCI_TRACES = tuple(
+    (
+        f"TRACE{i+1}_",
+        tuple(
+            (f"{chip}_SCI_FLUX{i}", f"{chip}_SCI_WAVE{i}", f"{chip}_SCI_VAR{i}")
+            for chip in ("GREEN", "RED")
+        ),
+    )
+    for i in range(1, 4)
+)
+_FIBER_TRACES = tuple(
+    (
+        i,
+        f"TRACE{i}_",
+        tuple(
+            (f"{chip}_{fiber}_FLUX", f"{chip}_{fiber}_WAVE", f"{chip}_{fiber}_VAR")
+            for chip in ("GREEN", "RED")
+        ),
+    )
+    for i, fiber in ((1, "CAL"), (5, "SKY"))
+)
+
+# every image extension _read consumes, flattened for the concurrent
+# prefetch
+_IMAGE_EXTS = tuple(
+    ext
+    for trace in _SCI_TRACES + tuple(t[1:] for t in _FIBER_TRACES)
+    for chip_exts in trace[1]
+    for ext in chip_exts
+)
+
 
 # KPF Level2 Reader
 class KPFRV2(RV2):
@@ -60,38 +105,44 @@ class KPFRV2(RV2):
 
     def _read(self, hdul: fits.HDUList) -> None:
 
-        for i in range(1, 4):
+        # The per-trace image HDUs are independent reads, so materialize
+        # them concurrently; the copy() forces the page-ins inside the
+        # workers (with memmap the .data attribute alone is just a view
+        # and does no I/O), and numpy releases the GIL while copying. HDU
+        # resolution stays on this thread, only the data reads fan out.
+        hdus = {ext: hdul[ext] for ext in _IMAGE_EXTS}
+        with ThreadPoolExecutor(max_workers=min(8, len(_IMAGE_EXTS))) as pool:
+            arrays = dict(
+                zip(_IMAGE_EXTS, pool.map(lambda e: hdus[e].data.copy(), _IMAGE_EXTS))
+            )
+
+        for out_prefix, chip_exts in _SCI_TRACES:
             flux_array = None
             wave_array = None
             var_array = None
-            out_prefix = f"TRACE{i+1}_"
-
-            for c, chip in enumerate(["GREEN", "RED"]):
-                flux_ext = f"{chip}_SCI_FLUX{i}"
-                wave_ext = f"{chip}_SCI_WAVE{i}"
-                var_ext = f"{chip}_SCI_VAR{i}"
 
+            for flux_ext, wave_ext, var_ext in chip_exts:
                 if flux_array is None:
-                    flux_array = hdul[flux_ext].data
-                    flux_meta = OrderedDict(hdul[flux_ext].header)
+                    flux_array = arrays[flux_ext]
+                    flux_meta = hdul[flux_ext].header
                 else:
                     flux_array = np.concatenate(
-                        (flux_array, hdul[flux_ext].data), axis=0
+                        (flux_array, arrays[flux_ext]), axis=0
                     )
 
                 if wave_array is None:
-                    wave_array = hdul[wave_ext].data
-                    wave_meta = OrderedDict(hdul[wave_ext].header)
+                    wave_array = arrays[wave_ext]
+                    wave_meta = hdul[wave_ext].header
                 else:
                     wave_array = np.concatenate(
-                        (wave_array, hdul[wave_ext].data), axis=0
+                        (wave_array, arrays[wave_ext]), axis=0
                     )
 
                 if var_array is None:
-                    var_array = hdul[var_ext].data
-                    var_meta = OrderedDict(hdul[var_ext].header)
+                    var_array = arrays[var_ext]
+                    var_meta = hdul[var_ext].header
                 else:
-                    var_array = np.concatenate((var_array, hdul[var_ext].data), axis=0)
+                    var_array = np.concatenate((var_array, arrays[var_ext]), axis=0)
 
             self.create_extension(
                 out_prefix + "FLUX", "ImageHDU", data=flux_array, header=flux_meta
@@ -107,38 +158,33 @@ class KPFRV2(RV2):
                 out_prefix + "BLAZE", "ImageHDU", data=blaze, header=flux_meta
             )
 
-        for i, fiber in zip([1, 5], ["CAL", "SKY"]):
+        for i, out_prefix, chip_exts in _FIBER_TRACES:
             flux_array = None
             wave_array = None
             var_array = None
-            out_prefix = f"TRACE{i}_"
-
-            for c, chip in enumerate(["GREEN", "RED"]):
-                flux_ext = f"{chip}_{fiber}_FLUX"
-                wave_ext = f"{chip}_{fiber}_WAVE"
-                var_ext = f"{chip}_{fiber}_VAR"
 
+            for flux_ext, wave_ext, var_ext in chip_exts:
                 if flux_array is None:
-                    flux_array = hdul[flux_ext].data
-                    flux_meta = OrderedDict(hdul[flux_ext].header)
+                    flux_array = arrays[flux_ext]
+                    flux_meta = hdul[flux_ext].header
                 else:
                     flux_array = np.concatenate(
-                        (flux_array, hdul[flux_ext].data), axis=0
+                        (flux_array, arrays[flux_ext]), axis=0
                     )
 
                 if wave_array is None:
-                    wave_array = hdul[wave_ext].data
-                    wave_meta = OrderedDict(hdul[wave_ext].header)
+                    wave_array = arrays[wave_ext]
+                    wave_meta = hdul[wave_ext].header
                 else:
                     wave_array = np.concatenate(
-                        (wave_array, hdul[wave_ext].data), axis=0
+                        (wave_array, arrays[wave_ext]), axis=0
                     )
 
                 if var_array is None:
-                    var_array = hdul[var_ext].data
-                    var_meta = OrderedDict(hdul[var_ext].header)
+                    var_array = arrays[var_ext]
+                    var_meta = hdul[var_ext].header
                 else:
-                    var_array = np.concatenate((var_array, hdul[var_ext].data), axis=0)
+                    var_array = np.concatenate((var_array, arrays[var_ext]), axis=0)
 
             if i == 1:
                 self.set_header(out_prefix + "FLUX", flux_meta)
@@ -173,37 +219,47 @@ class KPFRV2(RV2):
         self.set_header("DRIFT", wave_meta)
         self.set_data("DRIFT", np.zeros_like(flux_array))
 
-        self.set_header("BARYCORR_KMS", OrderedDict(hdul["BARY_CORR"].header))
-        self.set_header("BARYCORR_Z", OrderedDict(hdul["BARY_CORR"].header))
+        self.set_header("BARYCORR_KMS", hdul["BARY_CORR"].header)
+        self.set_header("BARYCORR_Z", hdul["BARY_CORR"].header)
         self.set_data("BARYCORR_KMS", bary_kms)
         self.set_data("BARYCORR_Z", bary_kms / 3e5)  # aproximate!!!
 
-        self.set_header("BJD_TDB", OrderedDict(hdul["BARY_CORR"].header))
+        self.set_header("BJD_TDB", hdul["BARY_CORR"].header)
         self.set_data("BJD_TDB", bary["PHOTON_BJD"])
 
         self.set_header("INSTRUMENT_HEADER", hdul["PRIMARY"].header)
 
-        self.set_header("DRP_CONFIG", OrderedDict(hdul["CONFIG"].header))
+        self.set_header("DRP_CONFIG", hdul["CONFIG"].header)
         self.set_data("DRP_CONFIG", Table(hdul["CONFIG"].data).to_pandas())
 
-        self.set_header("RECEIPT", OrderedDict(hdul["RECEIPT"].header))
+        self.set_header("RECEIPT", hdul["RECEIPT"].header)
         self.set_data("RECEIPT", Table(hdul["RECEIPT"].data).to_pandas())
 
-        hmap_path = os.path.join(os.path.dirname(__file__), 'config/header_map.csv')
-        headmap = pd.read_csv(hmap_path, header=0)
+        headmap = _HEADER_MAP
 
         phead = fits.PrimaryHDU().header
         ihead = self.headers['INSTRUMENT_HEADER']
-        for i, row in headmap.iterrows():
-            skey = row['STANDARD']
-            kpfkey = row['INSTRUMENT']
+
+        # Header.__getitem__ is slow; one sequential scan over the cards
+        # collects every mapped keyword instead of one hash lookup per row
+        ivals = {}
+        for card in ihead.cards:
+            if card.keyword in _MAPPED_KEYS and card.keyword not in ivals:
+                ivals[card.keyword] = card.value
+
+        # Accumulate the translated cards and apply them in one extend()
+        # call; per-card Header.__setitem__ rescans the keyword index
+        # each time.
+        # itertuples avoids the per-row Series construction of iterrows
+        cards = []
+        for row in headmap.itertuples(index=False):
+            skey = row.STANDARD
+            kpfkey = row.INSTRUMENT
             if pd.notnull(kpfkey):
-                kpfval = ihead[kpfkey]
-            else:
-                kpfval = row['DEFAULT']
-            if pd.notnull(kpfval):
-                phead[skey] = kpfval
+                kpfval = ivals[kpfkey]
             else:
-                phead[skey] = None
+                kpfval = row.DEFAULT
+            cards.append((skey, kpfval if pd.notnull(kpfval) else None))
+        phead.extend(cards, update=True)
 
         self.set_header("PRIMARY", phead)